@@ -11,31 +11,30 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
 import sys
-import time
 import logging
-from datetime import datetime, timedelta, timezone
-
-import requests
-
-from src.api import fetch_model_pricing
-from src.scraper import (
-    scrape_rankings,
-    scrape_rankings_history,
-    scrape_all_model_activities,
-    scrape_model_daily_data,
-    sum_daily_window,
-    HEADERS as SCRAPER_HEADERS,
-    REQUEST_DELAY,
-)
-from src.calculator import calculate_revenue
-from src.readme_gen import generate_readme, load_history
+from datetime import date, datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NOTE: src.* modules (and their requests/lxml/numpy/httpx dependency
+# graph) are imported lazily inside the functions that need them, so
+# `--help` and the existing-snapshot fast path stay cheap to start.
 
 # --- Configuration ---
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 README_PATH = os.path.join(os.path.dirname(__file__), "README.md")
+# Sidecar hash of the last README written; lets an unchanged regeneration
+# skip the rewrite (no mtime bump, no git churn in the weekly CI run)
+README_HASH_PATH = os.path.join(DATA_DIR, ".cache", "readme.hash")
 
 logging.basicConfig(
     level=logging.INFO,
@@ -60,6 +59,21 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Number of past weeks to backfill (default: 0 = all available). Only used with --backfill.",
     )
+    parser.add_argument(
+        "--refresh-pricing",
+        action="store_true",
+        help="Bypass the on-disk pricing cache and re-fetch from the API.",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the on-disk daily analytics cache during backfill.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk HTML cache (always download full pages).",
+    )
     return parser.parse_args()
 
 
@@ -67,10 +81,18 @@ def main():
     args = parse_args()
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
+    if args.no_cache:
+        from src.scraper import set_html_cache_enabled
+        set_html_cache_enabled(False)
+
     if args.backfill:
-        return run_backfill(args.weeks, today)
+        return run_backfill(
+            args.weeks, today,
+            refresh_pricing=args.refresh_pricing,
+            use_cache=not args.fresh,
+        )
     else:
-        return run_current(today)
+        return run_current(today, refresh_pricing=args.refresh_pricing)
 
 
 def _find_recent_snapshot(today: str, days_back: int = 6) -> str | None:
@@ -78,17 +100,22 @@ def _find_recent_snapshot(today: str, days_back: int = 6) -> str | None:
 
     Returns the date string of the existing snapshot, or None.
     """
-    today_dt = datetime.strptime(today, "%Y-%m-%d")
+    if not os.path.isdir(DATA_DIR):
+        return None
+    # List the directory once instead of stat-ing each candidate date
+    names = set(os.listdir(DATA_DIR))
+    today_dt = date.fromisoformat(today)
     for offset in range(0, days_back + 1):
-        check_date = (today_dt - timedelta(days=offset)).strftime("%Y-%m-%d")
-        check_path = os.path.join(DATA_DIR, f"{check_date}.json")
-        if os.path.exists(check_path):
+        check_date = (today_dt - timedelta(days=offset)).isoformat()
+        if f"{check_date}.json" in names:
             return check_date
     return None
 
 
-def run_current(today: str) -> int:
+def run_current(today: str, refresh_pricing: bool = False) -> int:
     """Normal mode: collect current week's data and generate README."""
+    from src.readme_gen import generate_readme, load_history
+
     logger.info(f"=== OpenRouter Revenue Stats Collection: {today} ===")
 
     # Check for an existing snapshot within the current week to avoid duplicates
@@ -101,15 +128,17 @@ def run_current(today: str) -> int:
         # Still regenerate README in case code changed
         history = load_history()
         if history:
-            readme_content = generate_readme(history[-1], history)
-            with open(README_PATH, "w") as f:
-                f.write(readme_content)
+            write_readme(generate_readme(history[-1], history))
             logger.info(f"  README regenerated from existing data.")
         return 0
 
+    from src.api import fetch_model_pricing
+    from src.scraper import scrape_rankings, scrape_all_model_activities
+    from src.calculator import calculate_revenue
+
     # Step 1: Fetch model pricing from the API
     logger.info("Step 1: Fetching model pricing from API...")
-    pricing = fetch_model_pricing()
+    pricing = fetch_model_pricing(ttl_sec=0) if refresh_pricing else fetch_model_pricing()
     logger.info(f"  Loaded pricing for {len(pricing)} model entries")
 
     # Step 2: Scrape the rankings page
@@ -143,16 +172,18 @@ def run_current(today: str) -> int:
     # Step 6: Generate README
     logger.info("Step 6: Generating README...")
     history = load_history()
-    readme_content = generate_readme(snapshot, history)
-    with open(README_PATH, "w") as f:
-        f.write(readme_content)
-    logger.info(f"  README written to {README_PATH}")
+    write_readme(generate_readme(snapshot, history))
 
     _log_summary(revenue_data, today)
     return 0
 
 
-def run_backfill(num_weeks: int, today: str) -> int:
+def run_backfill(
+    num_weeks: int,
+    today: str,
+    refresh_pricing: bool = False,
+    use_cache: bool = True,
+) -> int:
     """Backfill mode: generate historical weekly snapshots.
 
     Uses the rankings page's embedded chart data to identify which models were
@@ -160,18 +191,23 @@ def run_backfill(num_weeks: int, today: str) -> int:
     daily analytics from each unique model's page to compute prompt/completion
     ratios and cached token counts for accurate revenue calculation.
     """
+    from src import daily_store
+    from src.api import fetch_model_pricing
+    from src.scraper import fetch_rankings_html, scrape_rankings_history
+    from src.scraper_async import scrape_model_daily_data_concurrent
+    from src.calculator import resolve_models
+    from src.readme_gen import generate_readme, load_history
+
     logger.info(f"=== Backfill Mode: generating {num_weeks} weeks of history ===")
 
     # Step 1: Fetch model pricing
     logger.info("Step 1: Fetching model pricing from API...")
-    pricing = fetch_model_pricing()
+    pricing = fetch_model_pricing(ttl_sec=0) if refresh_pricing else fetch_model_pricing()
     logger.info(f"  Loaded pricing for {len(pricing)} model entries")
 
     # Step 2: Scrape rankings page -- both current leaderboard and historical chart
     logger.info("Step 2: Scraping rankings page (current + historical chart)...")
-    resp = requests.get("https://openrouter.ai/rankings", headers=SCRAPER_HEADERS, timeout=30)
-    resp.raise_for_status()
-    rankings_html = resp.text
+    rankings_html = fetch_rankings_html()
 
     history_weeks = scrape_rankings_history(html=rankings_html)
     if not history_weeks:
@@ -180,8 +216,8 @@ def run_backfill(num_weeks: int, today: str) -> int:
 
     # Select the target weeks, excluding the partial current week
     last_entry = history_weeks[-1]
-    last_date = datetime.strptime(last_entry["week_start"], "%Y-%m-%d")
-    today_dt = datetime.strptime(today, "%Y-%m-%d")
+    last_date = date.fromisoformat(last_entry["week_start"])
+    today_dt = date.fromisoformat(today)
 
     # If the last entry's week_start is within the current week, it's partial
     if (today_dt - last_date).days < 7:
@@ -205,107 +241,98 @@ def run_backfill(num_weeks: int, today: str) -> int:
         all_slugs.update(week_data["models"].keys())
     logger.info(f"\nStep 3: {len(all_slugs)} unique model slugs across all target weeks")
 
-    # Step 4: Fetch daily analytics for each unique model (one request per model)
+    # Step 4: Fetch daily analytics for each unique model (one request per model,
+    # fanned out concurrently since this is pure I/O). The sqlite store lets
+    # us skip fetching models whose stored history already reaches yesterday;
+    # only new or stale slugs hit the network.
     logger.info("Step 4: Fetching daily analytics for all unique models...")
-    all_daily_data: dict[str, dict[str, dict]] = {}
-    for i, slug in enumerate(sorted(all_slugs)):
-        logger.info(f"  [{i+1}/{len(all_slugs)}] {slug}")
-        all_daily_data[slug] = scrape_model_daily_data(slug)
-        if i < len(all_slugs) - 1:
-            time.sleep(REQUEST_DELAY)
-
-    # Build a name lookup: try pricing first, then use the slug's model part
-    name_lookup = {}
-    for slug in all_slugs:
-        # Check pricing map for a display name
-        if slug in pricing and pricing[slug].get("name"):
-            name_lookup[slug] = pricing[slug]["name"]
-        else:
-            base = slug.split(":")[0]
-            if base in pricing and pricing[base].get("name"):
-                name_lookup[slug] = pricing[base]["name"]
-            else:
-                # Derive a name from the slug: "author/model-name" -> "Model Name"
-                model_part = slug.split("/")[-1].split(":")[0]
-                name_lookup[slug] = model_part.replace("-", " ").title()
+    if use_cache:
+        conn = daily_store.connect()
+        yesterday = (today_dt - timedelta(days=1)).isoformat()
+        stored = {slug: daily_store.load_daily(conn, slug) for slug in all_slugs}
+        to_fetch = sorted(
+            slug for slug, daily in stored.items()
+            if not daily or max(daily) < yesterday
+        )
+        logger.info(
+            f"  {len(all_slugs) - len(to_fetch)}/{len(all_slugs)} slugs already "
+            f"current in the daily store; fetching {len(to_fetch)}"
+        )
+        fresh_data = scrape_model_daily_data_concurrent(to_fetch) if to_fetch else {}
+
+        # Merge fresh days over stored ones: past days are immutable, so
+        # stored dates fill in anything the fresh scrape no longer exposes
+        # (or failed on)
+        all_daily_data = {}
+        for slug in all_slugs:
+            merged = {**stored[slug], **fresh_data.get(slug, {})}
+            if fresh_data.get(slug):
+                daily_store.save_daily(conn, slug, merged)
+            all_daily_data[slug] = merged
+        conn.close()
+    else:
+        all_daily_data = scrape_model_daily_data_concurrent(sorted(all_slugs))
+
+    # Resolve display names and pricing entries for all slugs in one scan,
+    # sharing the same resolution logic the calculator uses
+    name_lookup, resolved_pricing = resolve_models(all_slugs, pricing)
 
     # Step 5: Generate weekly snapshots
     logger.info(f"\nStep 5: Calculating {len(target_weeks)} weekly snapshots...")
 
+    # Previous-week reference for WoW, aligned 1:1 with target_weeks. The
+    # first target week looks further back into complete_weeks when the
+    # selected window does not start at the beginning of history.
+    complete_idx_by_week_start = {w["week_start"]: k for k, w in enumerate(complete_weeks)}
+    prev_models_by_week: list[dict] = []
     for i, week_data in enumerate(target_weeks):
-        week_start = week_data["week_start"]
-        week_start_dt = datetime.strptime(week_start, "%Y-%m-%d")
-        week_end_dt = week_start_dt + timedelta(days=6)
-        week_end = week_end_dt.strftime("%Y-%m-%d")
+        if i > 0:
+            prev_models_by_week.append(target_weeks[i - 1]["models"])
+        else:
+            full_idx = complete_idx_by_week_start[week_data["week_start"]] - 1
+            prev_models_by_week.append(
+                complete_weeks[full_idx]["models"] if full_idx >= 0 else {}
+            )
+
+    # Each week is independent, and calculate_revenue is the one CPU-bound
+    # step in the pipeline -- fan the weeks out over a process pool for long
+    # backfills, staying serial for short ones to skip pool startup cost.
+    compute = functools.partial(
+        _compute_week,
+        all_daily_data=all_daily_data,
+        pricing=pricing,
+        name_lookup=name_lookup,
+        resolved_pricing=resolved_pricing,
+    )
+    if len(target_weeks) <= 4:
+        results = [
+            compute(week_data, prev_models_by_week[i])
+            for i, week_data in enumerate(target_weeks)
+        ]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = list(pool.map(compute, target_weeks, prev_models_by_week))
 
+    # Save snapshots in the main process
+    for i, (week_data, (week_end, revenue_data)) in enumerate(zip(target_weeks, results)):
+        week_start = week_data["week_start"]
         logger.info(f"\n--- Week {i+1}/{len(target_weeks)}: {week_start} to {week_end} ---")
 
-        # Build rankings list from the chart data for this week
-        week_models = week_data["models"]  # slug -> token count
-
-        # Get previous week for WoW calculation
-        prev_idx = target_weeks.index(week_data) - 1
-        prev_models = {}
-        if i > 0:
-            prev_models = target_weeks[i - 1]["models"]
-        elif len(complete_weeks) > len(target_weeks):
-            # Look further back in history
-            full_idx = complete_weeks.index(week_data) - 1
-            if full_idx >= 0:
-                prev_models = complete_weeks[full_idx]["models"]
-
-        # Build activity dicts from daily analytics for this week's window
-        activities = {}
-        rankings_list = []
-        rank = 0
-
-        # Sort models by token count descending
-        sorted_models = sorted(week_models.items(), key=lambda x: x[1], reverse=True)
-
-        models_with_data = 0
-        for slug, chart_tokens in sorted_models:
-            rank += 1
-            daily = all_daily_data.get(slug, {})
-            activity = sum_daily_window(daily, week_end, days=7, skip_partial=False)
-            activities[slug] = activity
-
-            if activity.get("prompt_tokens", 0) + activity.get("completion_tokens", 0) > 0:
-                models_with_data += 1
-
-            # WoW % change
-            prev_tokens = prev_models.get(slug, 0)
-            if prev_tokens > 0:
-                pct_change = round((chart_tokens - prev_tokens) / prev_tokens * 100)
-            else:
-                pct_change = 0
-
-            name = name_lookup.get(slug, slug.split("/")[-1])
-
-            rankings_list.append({
-                "rank": rank,
-                "slug": slug,
-                "name": name,
-                "total_tokens": chart_tokens,
-                "percent_change": pct_change,
-            })
-
         # Skip this week entirely if daily analytics are unavailable
-        if models_with_data == 0:
+        if revenue_data is None:
             logger.info(f"  SKIPPED: no daily analytics data available for this week")
             continue
 
-        # Calculate revenue
-        revenue_data = calculate_revenue(rankings_list, activities, pricing)
-
         # Save snapshot (use the week-ending Sunday as the date)
         snapshot = {"date": week_end, **revenue_data}
         save_snapshot(snapshot, week_end)
 
-        logger.info(
-            f"  Revenue: ${revenue_data['total_revenue']:,.2f} | "
-            f"Tokens: {revenue_data['total_tokens']:,} | "
-            f"Models: {len(sorted_models)} named + Others"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"  Revenue: ${revenue_data['total_revenue']:,.2f} | "
+                f"Tokens: {revenue_data['total_tokens']:,} | "
+                f"Models: {len(week_data['models'])} named + Others"
+            )
 
     # Step 6: Regenerate README with full history
     logger.info("\nStep 6: Generating README with full history...")
@@ -315,21 +342,123 @@ def run_backfill(num_weeks: int, today: str) -> int:
     else:
         latest_snapshot = {"date": today}
 
-    readme_content = generate_readme(latest_snapshot, history)
-    with open(README_PATH, "w") as f:
-        f.write(readme_content)
-    logger.info(f"  README written to {README_PATH}")
+    write_readme(generate_readme(latest_snapshot, history))
 
     logger.info(f"\n=== Backfill complete! Generated {len(target_weeks)} weekly snapshots ===")
     return 0
 
 
+def _compute_week(
+    week_data: dict,
+    prev_models: dict,
+    all_daily_data: dict[str, dict[str, dict]],
+    pricing: dict,
+    name_lookup: dict[str, str],
+    resolved_pricing: dict[str, dict | None] | None = None,
+) -> tuple[str, dict | None]:
+    """Build one backfill week's rankings/activities and calculate revenue.
+
+    Top-level (picklable) so weeks can be fanned out over a process pool.
+
+    Returns:
+        (week_end, revenue_data); revenue_data is None when no daily
+        analytics are available for the week.
+    """
+    from src.scraper import sum_daily_window
+    from src.calculator import calculate_revenue
+
+    week_start_dt = date.fromisoformat(week_data["week_start"])
+    week_end = (week_start_dt + timedelta(days=6)).isoformat()
+
+    # Build rankings list from the chart data for this week
+    week_models = week_data["models"]  # slug -> token count
+
+    # Build activity dicts from daily analytics for this week's window
+    activities = {}
+    rankings_list = []
+    rank = 0
+
+    # Sort models by token count descending
+    sorted_models = sorted(week_models.items(), key=lambda x: x[1], reverse=True)
+
+    models_with_data = 0
+    for slug, chart_tokens in sorted_models:
+        rank += 1
+        daily = all_daily_data.get(slug, {})
+        activity = sum_daily_window(daily, week_end, days=7, skip_partial=False)
+        activities[slug] = activity
+
+        if activity.get("prompt_tokens", 0) + activity.get("completion_tokens", 0) > 0:
+            models_with_data += 1
+
+        # WoW % change
+        prev_tokens = prev_models.get(slug, 0)
+        if prev_tokens > 0:
+            pct_change = round((chart_tokens - prev_tokens) / prev_tokens * 100)
+        else:
+            pct_change = 0
+
+        name = name_lookup.get(slug, slug.split("/")[-1])
+
+        rankings_list.append({
+            "rank": rank,
+            "slug": slug,
+            "name": name,
+            "total_tokens": chart_tokens,
+            "percent_change": pct_change,
+        })
+
+    if models_with_data == 0:
+        return week_end, None
+
+    return week_end, calculate_revenue(rankings_list, activities, pricing, resolved_pricing)
+
+
+def write_readme(content: str):
+    """Write README.md atomically, skipping the write when nothing changed.
+
+    The new content is hashed and compared against a sidecar of the last
+    write; an identical README is left untouched so its mtime stays put and
+    the weekly CI run produces no empty commit. Writes go through a tmp
+    file + os.replace like the snapshots.
+    """
+    new_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    if os.path.exists(README_PATH):
+        try:
+            with open(README_HASH_PATH, "r") as f:
+                if f.read().strip() == new_hash:
+                    logger.info("  README unchanged, skipping write")
+                    return
+        except IOError:
+            pass
+
+    tmp_path = README_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(content)
+    os.replace(tmp_path, README_PATH)
+
+    os.makedirs(os.path.dirname(README_HASH_PATH), exist_ok=True)
+    tmp_hash = README_HASH_PATH + ".tmp"
+    with open(tmp_hash, "w") as f:
+        f.write(new_hash)
+    os.replace(tmp_hash, README_HASH_PATH)
+    logger.info(f"  README written to {README_PATH}")
+
+
 def save_snapshot(snapshot: dict, date: str):
     """Save a revenue snapshot to data/{date}.json."""
     os.makedirs(DATA_DIR, exist_ok=True)
     filepath = os.path.join(DATA_DIR, f"{date}.json")
-    with open(filepath, "w") as f:
-        json.dump(snapshot, f, indent=2)
+    # Write to a tmp file and rename so a killed process never leaves a
+    # truncated snapshot behind for load_history to choke on
+    tmp_path = filepath + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, indent=2)
+    os.replace(tmp_path, filepath)
     logger.info(f"  Snapshot saved to {filepath}")
 
 
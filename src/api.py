@@ -1,19 +1,73 @@
 """Fetch model pricing data from the OpenRouter public API."""
 
+import json
+import logging
+import os
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # ~3x faster than stdlib json for the catalog response
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 MODELS_API_URL = "https://openrouter.ai/api/v1/models"
 
+# On-disk cache for the parsed pricing map. Prices change rarely, so a
+# fresh-enough cache skips the full catalog download on every run.
+PRICING_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", ".cache", "pricing.json"
+)
+PRICING_CACHE_TTL = 86400  # seconds (24 h)
+
 # Headers to mimic a normal browser request
 HEADERS = {
     "User-Agent": "OpenRouter-Inference-Stats/1.0 (https://github.com)",
     "Accept": "application/json",
 }
 
+# Single shared session: every request in a run hits openrouter.ai, so
+# keep-alive + connection pooling avoids a TLS handshake per call.
+# Retry transient rate-limits and 5xx with exponential backoff -- a single
+# 502 or 429 must not abort a long backfill. GETs are idempotent, so
+# retrying is always safe; Retry-After headers are honored on 429s.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=1.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+)
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=_RETRY,
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
 
-def fetch_model_pricing() -> dict:
+
+def get_session() -> requests.Session:
+    """Return the shared pooled session used for all OpenRouter HTTP calls."""
+    return _SESSION
+
+
+def fetch_model_pricing(
+    cache_path: str = PRICING_CACHE_PATH,
+    ttl_sec: int = PRICING_CACHE_TTL,
+) -> dict:
     """Fetch all models and return a dict mapping canonical_slug -> pricing info.
 
+    The parsed pricing map is cached on disk; if the cache is younger than
+    ttl_sec the network fetch is skipped entirely. Pass ttl_sec=0 to force
+    a refresh.
+
     Returns:
         dict: {
             "anthropic/claude-4.5-sonnet-20250929": {
@@ -28,9 +82,13 @@ def fetch_model_pricing() -> dict:
             ...
         }
     """
-    resp = requests.get(MODELS_API_URL, headers=HEADERS, timeout=30)
+    cached = _load_pricing_cache(cache_path, ttl_sec)
+    if cached is not None:
+        return cached
+
+    resp = _SESSION.get(MODELS_API_URL, headers=HEADERS, timeout=30)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
 
     pricing_map = {}
     for model in data.get("data", []):
@@ -69,9 +127,46 @@ def fetch_model_pricing() -> dict:
         if model_id:
             pricing_map[model_id] = entry
 
+        # Also index by the base slug (before any ":variant" suffix) so
+        # variant slugs like "author/model:free" resolve with a single dict
+        # hit. Never clobber an existing, more specific entry.
+        for key in (canonical_slug, model_id):
+            base = key.split(":")[0]
+            if base and base not in pricing_map:
+                pricing_map[base] = entry
+
+    _save_pricing_cache(cache_path, pricing_map)
     return pricing_map
 
 
+def _load_pricing_cache(cache_path: str, ttl_sec: int) -> dict | None:
+    """Return the cached pricing map if it is younger than ttl_sec, else None."""
+    if ttl_sec <= 0 or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        age = time.time() - cached.get("fetched_at", 0)
+        if age < ttl_sec:
+            logger.info(f"Using cached pricing from {cache_path} (age {age/3600:.1f}h)")
+            return cached["pricing_map"]
+    except (json.JSONDecodeError, KeyError, IOError) as e:
+        logger.warning(f"Failed to load pricing cache {cache_path}: {e}")
+    return None
+
+
+def _save_pricing_cache(cache_path: str, pricing_map: dict):
+    """Write the pricing map to the cache atomically (tmp file + os.replace)."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"fetched_at": time.time(), "pricing_map": pricing_map}, f)
+        os.replace(tmp_path, cache_path)
+    except IOError as e:
+        logger.warning(f"Failed to write pricing cache {cache_path}: {e}")
+
+
 def _parse_price(value: str) -> float:
     """Parse a price string to float, returning 0.0 for empty/invalid values."""
     if not value:
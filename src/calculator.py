@@ -2,13 +2,62 @@
 
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Memo of slug -> resolved pricing entry, shared across calculate_revenue
+# calls: backfill resolves the same top models week after week against the
+# same pricing dict. Invalidated whenever a different pricing dict is seen.
+_resolved_pricing: dict[str, dict | None] = {}
+_resolved_pricing_key: int | None = None
+
+
+def resolve_model(
+    slug: str,
+    pricing: dict,
+    author_index: dict[str, list[tuple[str, dict, frozenset[str]]]] | None = None,
+) -> tuple[str, dict | None]:
+    """Resolve a slug to its display name and pricing entry in one traversal.
+
+    The name comes from the resolved pricing entry when available, falling
+    back to a title-cased version of the slug's model part, so name and
+    pricing resolution always agree.
+    """
+    price_info = _find_pricing(slug, pricing, author_index)
+    if price_info and price_info.get("name"):
+        name = price_info["name"]
+    else:
+        # Derive a name from the slug: "author/model-name" -> "Model Name"
+        model_part = slug.split("/")[-1].split(":")[0]
+        name = model_part.replace("-", " ").title()
+    return name, price_info
+
+
+def resolve_models(
+    slugs,
+    pricing: dict,
+) -> tuple[dict[str, str], dict[str, dict | None]]:
+    """Resolve names and pricing entries for many slugs in a single scan.
+
+    Builds the author index once and shares it across all lookups.
+
+    Returns:
+        (name_lookup, resolved_pricing) dicts keyed by slug.
+    """
+    author_index = _build_author_index(pricing)
+    name_lookup = {}
+    resolved = {}
+    for slug in slugs:
+        name_lookup[slug], resolved[slug] = resolve_model(slug, pricing, author_index)
+    return name_lookup, resolved
+
 
 def calculate_revenue(
     rankings: list[dict],
     activities: dict[str, dict],
     pricing: dict[str, dict],
+    resolved_pricing: dict[str, dict | None] | None = None,
 ) -> dict:
     """Calculate estimated revenue for each model and total.
 
@@ -29,138 +78,178 @@ def calculate_revenue(
         rankings: List of model dicts from scrape_rankings()
         activities: Dict of slug -> activity dict from scrape_all_model_activities()
         pricing: Dict of slug -> pricing dict from fetch_model_pricing()
+        resolved_pricing: Optional pre-resolved slug -> pricing entry map
+            from resolve_models(); slugs found here skip _find_pricing
 
     Returns:
         dict with model-level and aggregate revenue data
     """
-    models_result = []
-    total_revenue = 0.0
-    total_tokens = 0
-    paid_count = 0
-    free_count = 0
-    agg_prompt = 0
-    agg_completion = 0
-    agg_reasoning = 0
-    agg_cached = 0
+    # First pass: gather per-model fields into parallel arrays (struct-of-arrays)
+    # so the revenue and ratio math runs as a handful of NumPy vector ops
+    # instead of per-model Python arithmetic.
+    meta = []
+    pt_list, ct_list, rt_list, cached_list, req_list = [], [], [], [], []
+    pp_list, cp_list, rp_list, crp_list = [], [], [], []
+
+    # Index pricing keys by author once so the fuzzy fallback in
+    # _find_pricing only scans same-author entries instead of the whole map.
+    pricing_by_author = _build_author_index(pricing)
+
+    global _resolved_pricing_key
+    if _resolved_pricing_key != id(pricing):
+        _resolved_pricing.clear()
+        _resolved_pricing_key = id(pricing)
 
     for model in rankings:
         slug = model["slug"]
-        name = model["name"]
-        rank = model["rank"]
-        ranking_total = model["total_tokens"]
-        percent_change = model.get("percent_change", 0)
 
         # Get exact token counts from embedded analytics
         activity = activities.get(slug, {})
         prompt_tokens = activity.get("prompt_tokens", 0)
         completion_tokens = activity.get("completion_tokens", 0)
-        reasoning_tokens = activity.get("reasoning_tokens", 0)
-        cached_tokens = activity.get("cached_tokens", 0)
-        request_count = activity.get("request_count", 0)
-
-        analytics_total = prompt_tokens + completion_tokens
 
         # If we have no analytics data, this model contributes $0 revenue.
         # We do NOT fall back to an assumed split — that produces inaccurate data.
-        if analytics_total == 0:
-            logger.warning(f"No analytics data for {slug}, skipping revenue (tokens stay as ranking total)")
-
-        # Calculate ratios from the actual data
-        if analytics_total > 0:
-            prompt_ratio = prompt_tokens / analytics_total
-            completion_ratio = completion_tokens / analytics_total
-            reasoning_ratio = reasoning_tokens / analytics_total
-        else:
-            prompt_ratio = 0.0
-            completion_ratio = 0.0
-            reasoning_ratio = 0.0
-
-        # Look up pricing
-        price_info = _find_pricing(slug, pricing)
-
-        prompt_price = price_info.get("prompt_price", 0.0) if price_info else 0.0
-        completion_price = price_info.get("completion_price", 0.0) if price_info else 0.0
-        reasoning_price = price_info.get("reasoning_price", 0.0) if price_info else 0.0
-        cache_read_price = 0.0
-        if price_info:
-            # Cache read price from API: input_cache_read field
-            cache_read_price = price_info.get("cache_read_price", 0.0)
-
-        is_free = (prompt_price == 0.0 and completion_price == 0.0)
-
-        # Revenue calculation:
-        # - Prompt tokens charged at prompt_price
-        # - Completion tokens (already includes reasoning) charged at completion_price
-        # - Cached tokens charged at cache_read_price (discounted input)
-        # NOTE: We do NOT separately charge reasoning -- it's already in completion_tokens
-        revenue = (
-            prompt_tokens * prompt_price
-            + completion_tokens * completion_price
-            + cached_tokens * cache_read_price
-        )
-
-        if is_free:
-            free_count += 1
+        if prompt_tokens + completion_tokens == 0:
+            logger.warning("No analytics data for %s, skipping revenue (tokens stay as ranking total)", slug)
+
+        # Look up pricing (memoized: repeat slugs skip the fallback scan)
+        if resolved_pricing is not None and slug in resolved_pricing:
+            price_info = resolved_pricing[slug]
+        elif slug in _resolved_pricing:
+            price_info = _resolved_pricing[slug]
         else:
-            paid_count += 1
-
-        total_revenue += revenue
-        total_tokens += ranking_total
-        agg_prompt += prompt_tokens
-        agg_completion += completion_tokens
-        agg_reasoning += reasoning_tokens
-        agg_cached += cached_tokens
-
-        models_result.append({
-            "rank": rank,
+            price_info = _find_pricing(slug, pricing, pricing_by_author)
+            _resolved_pricing[slug] = price_info
+
+        pt_list.append(prompt_tokens)
+        ct_list.append(completion_tokens)
+        rt_list.append(activity.get("reasoning_tokens", 0))
+        cached_list.append(activity.get("cached_tokens", 0))
+        req_list.append(activity.get("request_count", 0))
+        pp_list.append(price_info.get("prompt_price", 0.0) if price_info else 0.0)
+        cp_list.append(price_info.get("completion_price", 0.0) if price_info else 0.0)
+        rp_list.append(price_info.get("reasoning_price", 0.0) if price_info else 0.0)
+        # Cache read price from API: input_cache_read field
+        crp_list.append(price_info.get("cache_read_price", 0.0) if price_info else 0.0)
+
+        meta.append({
+            "rank": model["rank"],
             "slug": slug,
-            "name": name,
-            "total_tokens": ranking_total,
-            "percent_change": percent_change,
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "reasoning_tokens": reasoning_tokens,
-            "cached_tokens": cached_tokens,
-            "request_count": request_count,
-            "prompt_ratio": round(prompt_ratio, 4),
-            "completion_ratio": round(completion_ratio, 4),
-            "reasoning_ratio": round(reasoning_ratio, 4),
-            "prompt_price": prompt_price,
-            "completion_price": completion_price,
-            "reasoning_price": reasoning_price,
-            "cache_read_price": cache_read_price,
-            "estimated_revenue": round(revenue, 2),
-            "is_free": is_free,
+            "name": model["name"],
+            "total_tokens": model["total_tokens"],
+            "percent_change": model.get("percent_change", 0),
         })
 
-        logger.info(
-            f"  #{rank} {name}: {_format_tokens(ranking_total)} tokens, "
-            f"prompt={prompt_ratio*100:.1f}%, comp={completion_ratio*100:.1f}%, "
-            f"cached={_format_tokens(cached_tokens)}, "
-            f"${revenue:,.2f} revenue"
-            f"{' (FREE)' if is_free else ''}"
-        )
+    pt = np.asarray(pt_list, dtype=np.int64)
+    ct = np.asarray(ct_list, dtype=np.int64)
+    rt = np.asarray(rt_list, dtype=np.int64)
+    cached = np.asarray(cached_list, dtype=np.int64)
+    pp = np.asarray(pp_list, dtype=np.float64)
+    cp = np.asarray(cp_list, dtype=np.float64)
+    crp = np.asarray(crp_list, dtype=np.float64)
+
+    # Revenue calculation:
+    # - Prompt tokens charged at prompt_price
+    # - Completion tokens (already includes reasoning) charged at completion_price
+    # - Cached tokens charged at cache_read_price (discounted input)
+    # NOTE: We do NOT separately charge reasoning -- it's already in completion_tokens
+    revenue = pt * pp + ct * cp + cached * crp
+
+    # Ratios are display-only fields, computed after the revenue math so the
+    # hot path stays integer-tokens x float-prices with no divisions.
+    # Models without analytics get 0.0.
+    analytics_total = (pt + ct).astype(np.float64)
+    has_data = analytics_total > 0
+    prompt_ratio = np.divide(pt, analytics_total, out=np.zeros(len(pt)), where=has_data)
+    completion_ratio = np.divide(ct, analytics_total, out=np.zeros(len(pt)), where=has_data)
+    reasoning_ratio = np.divide(rt, analytics_total, out=np.zeros(len(pt)), where=has_data)
+
+    is_free = (pp == 0.0) & (cp == 0.0)
+    free_count = int(np.count_nonzero(is_free))
+    paid_count = len(meta) - free_count
+
+    # Second pass: zip the vector results back into per-model dicts
+    models_result = []
+    for i, m in enumerate(meta):
+        models_result.append({
+            **m,
+            "prompt_tokens": pt_list[i],
+            "completion_tokens": ct_list[i],
+            "reasoning_tokens": rt_list[i],
+            "cached_tokens": cached_list[i],
+            "request_count": req_list[i],
+            "prompt_ratio": round(float(prompt_ratio[i]), 4),
+            "completion_ratio": round(float(completion_ratio[i]), 4),
+            "reasoning_ratio": round(float(reasoning_ratio[i]), 4),
+            "prompt_price": pp_list[i],
+            "completion_price": cp_list[i],
+            "reasoning_price": rp_list[i],
+            "cache_read_price": crp_list[i],
+            "estimated_revenue": round(float(revenue[i]), 2),
+            "is_free": bool(is_free[i]),
+        })
 
-    # Sort by revenue descending
-    models_result.sort(key=lambda x: x["estimated_revenue"], reverse=True)
+        # Guarded + lazy %-formatting: skip _format_tokens and the float
+        # formatting entirely when INFO logging is off (bulk backfills)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "  #%d %s: %s tokens, prompt=%.1f%%, comp=%.1f%%, cached=%s, "
+                "$%.2f revenue%s",
+                m["rank"], m["name"], _format_tokens(m["total_tokens"]),
+                prompt_ratio[i] * 100, completion_ratio[i] * 100,
+                _format_tokens(cached_list[i]), revenue[i],
+                " (FREE)" if is_free[i] else "",
+            )
+
+    # Sort by revenue descending: reuse the vectorized revenue array instead
+    # of re-comparing the assembled dicts in Python. Stable on the rounded
+    # values to match the previous sort's tie-breaking.
+    order = np.argsort(-np.round(revenue, 2), kind="stable")
+    models_result = [models_result[i] for i in order]
 
     return {
         "models": models_result,
-        "total_revenue": round(total_revenue, 2),
-        "total_tokens": total_tokens,
+        "total_revenue": round(float(revenue.sum()), 2),
+        "total_tokens": sum(m["total_tokens"] for m in meta),
         "total_models": len(models_result),
         "paid_models": paid_count,
         "free_models": free_count,
         "token_breakdown": {
-            "prompt_tokens": agg_prompt,
-            "completion_tokens": agg_completion,
-            "reasoning_tokens": agg_reasoning,
-            "cached_tokens": agg_cached,
+            "prompt_tokens": int(pt.sum()),
+            "completion_tokens": int(ct.sum()),
+            "reasoning_tokens": int(rt.sum()),
+            "cached_tokens": int(cached.sum()),
         },
     }
 
 
-def _find_pricing(slug: str, pricing: dict) -> dict | None:
+def _tokenize_slug(slug: str) -> frozenset[str]:
+    """Split a slug into a set of word tokens for similarity matching."""
+    return frozenset(slug.lower().replace("-", " ").replace(".", " ").split())
+
+
+def _build_author_index(pricing: dict) -> dict[str, list[tuple[str, dict, frozenset[str]]]]:
+    """Index pricing entries by author prefix, with pre-tokenized keys.
+
+    Built once per calculate_revenue call so the fuzzy-match fallback in
+    _find_pricing is O(same-author entries) instead of O(all entries), and
+    each key is tokenized once instead of once per lookup.
+    """
+    index: dict[str, list[tuple[str, dict, frozenset[str]]]] = {}
+    for key, value in pricing.items():
+        if "/" not in key:
+            continue
+        author = key.split("/")[0]
+        index.setdefault(author, []).append((key, value, _tokenize_slug(key)))
+    return index
+
+
+def _find_pricing(
+    slug: str,
+    pricing: dict,
+    author_index: dict[str, list[tuple[str, dict, frozenset[str]]]] | None = None,
+) -> dict | None:
     """Find pricing info for a model slug, trying various key formats."""
     # Direct match
     if slug in pricing:
@@ -171,19 +260,20 @@ def _find_pricing(slug: str, pricing: dict) -> dict | None:
     if base_slug in pricing:
         return pricing[base_slug]
 
-    # Try partial match on the slug
-    for key, value in pricing.items():
-        if key.startswith(slug.split("/")[0] + "/") and _slug_similarity(slug, key) > 0.7:
+    # Try partial match against same-author entries only
+    if author_index is None:
+        author_index = _build_author_index(pricing)
+    slug_tokens = _tokenize_slug(slug)
+    for key, value, key_tokens in author_index.get(slug.split("/")[0], []):
+        if _slug_similarity(slug_tokens, key_tokens) > 0.7:
             return value
 
     logger.warning(f"No pricing found for slug: {slug}")
     return None
 
 
-def _slug_similarity(a: str, b: str) -> float:
-    """Simple similarity score between two slugs."""
-    a_parts = set(a.lower().replace("-", " ").replace(".", " ").split())
-    b_parts = set(b.lower().replace("-", " ").replace(".", " ").split())
+def _slug_similarity(a_parts: frozenset[str], b_parts: frozenset[str]) -> float:
+    """Jaccard similarity between two tokenized slugs."""
     if not a_parts or not b_parts:
         return 0.0
     intersection = a_parts & b_parts
@@ -191,14 +281,17 @@ def _slug_similarity(a: str, b: str) -> float:
     return len(intersection) / len(union)
 
 
+# Unit lookup for _format_tokens: digit count picks the scale directly,
+# avoiding a cascade of magnitude branches in the per-model logging path.
+_TOKEN_UNITS = ("", "K", "M", "B", "T")
+_TOKEN_DIVS = (1, 1_000, 1_000_000, 1_000_000_000, 1_000_000_000_000)
+
+
 def _format_tokens(count: int) -> str:
     """Format token count in human-readable form."""
-    if count >= 1_000_000_000_000:
-        return f"{count / 1_000_000_000_000:.2f}T"
-    if count >= 1_000_000_000:
-        return f"{count / 1_000_000_000:.1f}B"
-    if count >= 1_000_000:
-        return f"{count / 1_000_000:.1f}M"
-    if count >= 1_000:
-        return f"{count / 1_000:.1f}K"
-    return str(count)
+    if count < 1_000:
+        return str(count)
+    d = min((len(str(count)) - 1) // 3, 4)
+    if d == 4:
+        return f"{count / _TOKEN_DIVS[4]:.2f}T"
+    return f"{count / _TOKEN_DIVS[d]:.1f}{_TOKEN_UNITS[d]}"
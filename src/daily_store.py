@@ -0,0 +1,81 @@
+"""Persistent sqlite store for per-model daily analytics rows.
+
+Each weekly run used to re-fetch ~90 days of daily data for every model,
+even though only the most recent few days can have changed. Storing rows
+keyed by (slug, date) lets run_backfill skip the page fetch entirely for
+models whose stored history already reaches yesterday.
+"""
+
+import logging
+import os
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+DAILY_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "daily.sqlite"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily (
+    slug TEXT NOT NULL,
+    date TEXT NOT NULL,
+    prompt INTEGER NOT NULL DEFAULT 0,
+    completion INTEGER NOT NULL DEFAULT 0,
+    reasoning INTEGER NOT NULL DEFAULT 0,
+    cached INTEGER NOT NULL DEFAULT 0,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (slug, date)
+)
+"""
+
+
+def connect(db_path: str = DAILY_DB_PATH) -> sqlite3.Connection:
+    """Open the daily-analytics store, creating the schema if needed."""
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def load_daily(conn: sqlite3.Connection, slug: str) -> dict[str, dict]:
+    """All stored daily rows for a slug as {date -> totals} (scraper format)."""
+    rows = conn.execute(
+        "SELECT date, prompt, completion, reasoning, cached, count"
+        " FROM daily WHERE slug = ?",
+        (slug,),
+    )
+    return {
+        d: {"prompt": p, "completion": c, "reasoning": r, "cached": ca, "count": n}
+        for d, p, c, r, ca, n in rows
+    }
+
+
+def last_date(conn: sqlite3.Connection, slug: str) -> str | None:
+    """Most recent stored date for a slug, or None if nothing is stored."""
+    row = conn.execute(
+        "SELECT max(date) FROM daily WHERE slug = ?", (slug,)
+    ).fetchone()
+    return row[0]
+
+
+def save_daily(conn: sqlite3.Connection, slug: str, daily_data: dict[str, dict]):
+    """Upsert a slug's daily rows. Past days are immutable, so REPLACE is safe."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO daily"
+        " (slug, date, prompt, completion, reasoning, cached, count)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                slug,
+                d,
+                day.get("prompt", 0),
+                day.get("completion", 0),
+                day.get("reasoning", 0),
+                day.get("cached", 0),
+                day.get("count", 0),
+            )
+            for d, day in daily_data.items()
+        ],
+    )
+    conn.commit()
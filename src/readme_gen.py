@@ -1,9 +1,17 @@
 """Generate README.md with Mermaid charts and statistics tables."""
 
+import hashlib
 import json
+import math
 import os
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache, wraps
+
+try:
+    import orjson  # C parser, 3-10x faster for loading snapshot history
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -31,43 +39,94 @@ _PIE_INIT = f"%%{{init: {{'theme': 'base', 'themeVariables': {{{_PIE_THEME_VARS}
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 
+# On-disk cache for rendered Mermaid chart blocks, keyed on a hash of the
+# chart function's inputs. The charts are pure functions of their inputs,
+# so an unchanged key means the previous render is still valid -- which is
+# the common case for the long revenue-over-time chart between data updates.
+CHART_CACHE_DIR = os.path.join(DATA_DIR, ".cache", "charts")
+
+
+def _chart_cache(func):
+    """Reuse a rendered chart block from disk when its inputs are unchanged."""
+
+    @wraps(func)
+    def wrapper(*args):
+        try:
+            payload = json.dumps(
+                [func.__name__, args], sort_keys=True, default=str
+            ).encode()
+        except TypeError:
+            return func(*args)
+        key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        path = os.path.join(CHART_CACHE_DIR, f"{key}.mmd")
+        try:
+            with open(path, "r") as f:
+                return f.read()
+        except IOError:
+            pass
+        block = func(*args)
+        try:
+            os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(block)
+            os.replace(tmp_path, path)
+        except IOError as e:
+            logger.warning(f"Failed to write chart cache {path}: {e}")
+        return block
+
+    return wrapper
 
+
+# Scale lookup for the formatters below: the digit count of the value picks
+# the unit directly instead of cascading through magnitude branches. Results
+# are memoized since the same token counts and prices repeat across the
+# table rows and chart builders.
+_TOKEN_UNITS = ("", "K", "M", "B", "T")
+_TOKEN_DIVS = (1, 1_000, 1_000_000, 1_000_000_000, 1_000_000_000_000)
+
+
+@lru_cache(maxsize=4096)
 def format_tokens(count: int) -> str:
     """Format token count in human-readable form."""
-    if count >= 1_000_000_000_000:
-        return f"{count / 1_000_000_000_000:.2f}T"
-    if count >= 1_000_000_000:
-        return f"{count / 1_000_000_000:.1f}B"
-    if count >= 1_000_000:
-        return f"{count / 1_000_000:.1f}M"
-    if count >= 1_000:
-        return f"{count / 1_000:.1f}K"
-    return str(count)
+    if count < 1_000:
+        return str(count)
+    d = min((len(str(count)) - 1) // 3, 4)
+    if d == 4:
+        return f"{count / _TOKEN_DIVS[4]:.2f}T"
+    return f"{count / _TOKEN_DIVS[d]:.1f}{_TOKEN_UNITS[d]}"
 
 
 def format_dollars(amount: float) -> str:
     """Format dollar amounts with appropriate precision."""
-    if amount >= 1_000_000:
+    if amount < 1_000:
+        return f"${amount:,.2f}"
+    d = min((len(str(int(amount))) - 1) // 3, 2)
+    if d == 2:
         return f"${amount / 1_000_000:.2f}M"
-    if amount >= 1_000:
-        return f"${amount / 1_000:.1f}K"
-    return f"${amount:,.2f}"
+    return f"${amount / 1_000:.1f}K"
+
+
+# Characters that break Mermaid syntax, mapped to their replacements.
+# A single translate() pass replaces them all without re-allocating the
+# string once per character as chained .replace() calls would.
+_MERMAID_TBL = str.maketrans({
+    '"': "'",
+    "(": "",
+    ")": "",
+    "[": "",
+    "]": "",
+    "{": "",
+    "}": "",
+    "#": "",
+    ":": " -",
+    ";": "",
+})
 
 
 def _sanitize_mermaid_label(text: str) -> str:
     """Sanitize text for use in Mermaid labels (remove special chars)."""
-    # Remove characters that break Mermaid syntax
-    text = text.replace('"', "'")
-    text = text.replace("(", "")
-    text = text.replace(")", "")
-    text = text.replace("[", "")
-    text = text.replace("]", "")
-    text = text.replace("{", "")
-    text = text.replace("}", "")
-    text = text.replace("#", "")
-    text = text.replace(":", " -")
-    text = text.replace(";", "")
-    return text.strip()
+    return text.translate(_MERMAID_TBL).strip()
 
 
 def _truncate_label(text: str, max_len: int = 20) -> str:
@@ -112,24 +171,52 @@ def _bar_chart_label(text: str, max_len: int = 14) -> str:
     return text
 
 
+# Parsed-snapshot cache for load_history: filename -> (mtime_ns, size, data).
+# Snapshots are immutable once written, so an unchanged (mtime, size) pair
+# means the parsed dict can be reused without touching the file again.
+_HISTORY_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
 def load_history() -> list[dict]:
     """Load all historical snapshots from the data directory.
 
+    Parsed snapshots are memoized keyed on (mtime, size), so repeat calls
+    within a run only re-parse files that actually changed.
+
     Returns a list of snapshots sorted by date ascending.
     """
     snapshots = []
     if not os.path.isdir(DATA_DIR):
         return snapshots
 
-    for filename in sorted(os.listdir(DATA_DIR)):
-        if filename.endswith(".json"):
-            filepath = os.path.join(DATA_DIR, filename)
-            try:
-                with open(filepath, "r") as f:
-                    data = json.load(f)
-                snapshots.append(data)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load {filepath}: {e}")
+    # scandir yields DirEntry objects whose stat info comes from the batched
+    # directory read, so the mtime/size cache keys cost no extra syscalls.
+    with os.scandir(DATA_DIR) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json")), key=lambda e: e.name
+        )
+
+    seen = set()
+    for entry in entries:
+        try:
+            st = entry.stat()
+            cached = _HISTORY_CACHE.get(entry.name)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                seen.add(entry.name)
+                snapshots.append(cached[2])
+                continue
+            with open(entry.path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _HISTORY_CACHE[entry.name] = (st.st_mtime_ns, st.st_size, data)
+            seen.add(entry.name)
+            snapshots.append(data)
+        except (ValueError, IOError) as e:
+            logger.warning(f"Failed to load {entry.path}: {e}")
+
+    # Drop cache entries for files that disappeared from the data dir
+    for stale in set(_HISTORY_CACHE) - seen:
+        del _HISTORY_CACHE[stale]
 
     return snapshots
 
@@ -217,6 +304,7 @@ def _generate_summary(
 | Models Tracked | **{total_models}** ({paid_models} paid, {free_models} free) |"""
 
 
+@_chart_cache
 def _generate_revenue_over_time_chart(history: list[dict]) -> str:
     """Generate a Mermaid xychart for revenue over time.
 
@@ -235,30 +323,38 @@ def _generate_revenue_over_time_chart(history: list[dict]) -> str:
         r = snap.get("total_revenue", 0)
         revenues.append(round(r, 2))
         try:
-            dt = datetime.strptime(d, "%Y-%m-%d")
+            # fromisoformat is a C fast path; strptime re-parses the format
+            # string on every call.
+            dt = date.fromisoformat(d)
             # Short unique label: "2/16", "12/28", etc.
             dates.append(f'"{dt.month}/{dt.day:02d}"')
         except ValueError:
             dates.append(f'"{d}"')
 
-    x_axis = ", ".join(dates)
     y_values = ", ".join(str(r) for r in revenues)
 
     max_rev = max(revenues) if revenues else 1000
     y_max = _nice_axis_max(max_rev)
 
-    return f"""## Revenue Over Time
-
-```mermaid
-xychart-beta
-    title "Estimated Weekly Revenue (USD)"
-    x-axis [{x_axis}]
-    y-axis "Revenue ($)" 0 --> {y_max}
-    bar [{y_values}]
-    line [{y_values}]
-```"""
+    # Assemble via one list + join: for long histories this avoids copying
+    # the (large) axis strings again into an f-string template.
+    out = [
+        "## Revenue Over Time\n\n"
+        "```mermaid\n"
+        "xychart-beta\n"
+        '    title "Estimated Weekly Revenue (USD)"\n'
+        "    x-axis [",
+        ", ".join(dates),
+        f']\n    y-axis "Revenue ($)" 0 --> {y_max}\n    bar [',
+        y_values,
+        "]\n    line [",
+        y_values,
+        "]\n```",
+    ]
+    return "".join(out)
 
 
+@_chart_cache
 def _generate_revenue_bar_chart(models: list[dict]) -> str:
     """Generate a Mermaid xychart bar chart for top model revenue."""
     labels = []
@@ -268,23 +364,24 @@ def _generate_revenue_bar_chart(models: list[dict]) -> str:
         labels.append(f'"{label}"')
         values.append(round(m["estimated_revenue"], 2))
 
-    x_axis = ", ".join(labels)
-    y_values = ", ".join(str(v) for v in values)
-
     max_val = max(values) if values else 1000
     y_max = _nice_axis_max(max_val)
 
-    return f"""## Revenue by Model (Top {len(models)})
-
-```mermaid
-xychart-beta
-    title "Estimated Weekly Revenue by Model"
-    x-axis [{x_axis}]
-    y-axis "Revenue ($)" 0 --> {y_max}
-    bar [{y_values}]
-```"""
+    out = [
+        f"## Revenue by Model (Top {len(models)})\n\n"
+        "```mermaid\n"
+        "xychart-beta\n"
+        '    title "Estimated Weekly Revenue by Model"\n'
+        "    x-axis [",
+        ", ".join(labels),
+        f']\n    y-axis "Revenue ($)" 0 --> {y_max}\n    bar [',
+        ", ".join(str(v) for v in values),
+        "]\n```",
+    ]
+    return "".join(out)
 
 
+@_chart_cache
 def _generate_revenue_pie_chart(models: list[dict], total_revenue: float) -> str:
     """Generate a Mermaid pie chart for revenue share."""
     lines = []
@@ -302,18 +399,19 @@ def _generate_revenue_pie_chart(models: list[dict], total_revenue: float) -> str
         formatted_other = format_dollars(other)
         lines.append(f'    "Other {formatted_other}" : {round(other, 2)}')
 
-    pie_data = "\n".join(lines)
-
-    return f"""## Revenue Share
-
-```mermaid
-{_PIE_INIT}
-pie
-    title Revenue Share by Model
-{pie_data}
-```"""
+    out = [
+        "## Revenue Share\n\n"
+        "```mermaid\n"
+        f"{_PIE_INIT}\n"
+        "pie\n"
+        "    title Revenue Share by Model\n",
+        "\n".join(lines),
+        "\n```",
+    ]
+    return "".join(out)
 
 
+@_chart_cache
 def _generate_token_distribution_chart(token_breakdown: dict) -> str:
     """Generate a Mermaid pie chart for token type distribution."""
     prompt = token_breakdown.get("prompt_tokens", 0)
@@ -339,16 +437,16 @@ def _generate_token_distribution_chart(token_breakdown: dict) -> str:
     if not lines:
         return ""
 
-    pie_data = "\n".join(lines)
-
-    return f"""## Token Type Distribution
-
-```mermaid
-{_PIE_INIT}
-pie
-    title Token Distribution Across All Tracked Models
-{pie_data}
-```"""
+    out = [
+        "## Token Type Distribution\n\n"
+        "```mermaid\n"
+        f"{_PIE_INIT}\n"
+        "pie\n"
+        "    title Token Distribution Across All Tracked Models\n",
+        "\n".join(lines),
+        "\n```",
+    ]
+    return "".join(out)
 
 
 def _generate_model_table(models: list[dict]) -> str:
@@ -358,30 +456,28 @@ def _generate_model_table(models: list[dict]) -> str:
         "| Rank | Model | Total Tokens | Cached | Prompt % | Compl. % "
         "| Input Price | Output Price | Est. Revenue | WoW |\n"
         "|------|-------|-------------|--------|----------|----------"
-        "|-------------|-------------|-------------|-----|\n"
+        "|-------------|-------------|-------------|-----|"
     )
 
+    # Bind the formatters to locals once: LOAD_FAST in the row loop instead
+    # of a global lookup per cell.
+    _ft = format_tokens
+    _fd = format_dollars
+    _fp = _format_price_per_m
+    _fw = _format_wow
+
     rows = []
     for m in models:
-        rank = m["rank"]
-        name = m["name"]
-        slug = m["slug"]
-        tokens = format_tokens(m["total_tokens"])
-        cached = format_tokens(m.get("cached_tokens", 0))
-        p_ratio = f"{m['prompt_ratio'] * 100:.1f}%"
-        c_ratio = f"{m['completion_ratio'] * 100:.1f}%"
-        p_price = _format_price_per_m(m["prompt_price"])
-        c_price = _format_price_per_m(m["completion_price"])
-        revenue = format_dollars(m["estimated_revenue"])
-        wow = _format_wow(m.get("percent_change", 0))
-
-        link = f"[{name}](https://openrouter.ai/{slug})"
+        link = f"[{m['name']}](https://openrouter.ai/{m['slug']})"
         rows.append(
-            f"| {rank} | {link} | {tokens} | {cached} | {p_ratio} | {c_ratio} "
-            f"| {p_price} | {c_price} | {revenue} | {wow} |"
+            f"| {m['rank']} | {link} | {_ft(m['total_tokens'])} "
+            f"| {_ft(m.get('cached_tokens', 0))} "
+            f"| {m['prompt_ratio'] * 100:.1f}% | {m['completion_ratio'] * 100:.1f}% "
+            f"| {_fp(m['prompt_price'])} | {_fp(m['completion_price'])} "
+            f"| {_fd(m['estimated_revenue'])} | {_fw(m.get('percent_change', 0))} |"
         )
 
-    return header + "\n".join(rows)
+    return "\n".join([header, *rows])
 
 
 def _generate_methodology() -> str:
@@ -408,6 +504,7 @@ This data is collected automatically from public sources:
 *Data collected by [openrouter-inference-stats](https://github.com/johnbean393/openrouter-inference-stats) and updated weekly via GitHub Actions.*"""
 
 
+@lru_cache(maxsize=1024)
 def _format_price_per_m(price_per_token: float) -> str:
     """Format price as $/M tokens."""
     if price_per_token == 0:
@@ -431,9 +528,13 @@ def _nice_axis_max(value: float) -> int:
     """Calculate a nice round max value for chart axes."""
     if value <= 0:
         return 1000
-    # Round up to a nice number
-    import math
-    magnitude = 10 ** math.floor(math.log10(value))
+    # Round up to a nice number. For values >= 1 the magnitude comes from
+    # the integer digit count (exact, no float log); log10 only handles the
+    # sub-1 case.
+    if value >= 1:
+        magnitude = 10 ** (len(str(int(value))) - 1)
+    else:
+        magnitude = 10 ** math.floor(math.log10(value))
     normalized = value / magnitude
     if normalized <= 1.5:
         nice = 2
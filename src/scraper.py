@@ -1,15 +1,34 @@
 """Scrape OpenRouter rankings and model activity pages."""
 
+import concurrent.futures
+import gzip
+import hashlib
+import json
+import os
 import re
+import threading
 import time
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml.etree import XPath
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.api import get_session
 
 logger = logging.getLogger(__name__)
 
+
+def _json_loads(s: str):
+    """Decode JSON with orjson when available (C parser, ~3x faster)."""
+    return orjson.loads(s) if orjson is not None else json.loads(s)
+
 BASE_URL = "https://openrouter.ai"
 
 HEADERS = {
@@ -27,6 +46,106 @@ NAV_PREFIXES = ("docs/", "chat/", "settings/", "compare/", "apps", "models",
 # Delay between model page requests (seconds)
 REQUEST_DELAY = 1.5
 
+# Concurrent model-page fetches; politeness is enforced by a shared rate
+# limiter rather than per-request sleeps, so the aggregate request rate
+# stays at MAX_WORKERS requests per REQUEST_DELAY window
+MAX_WORKERS = 8
+
+
+class _RateLimiter:
+    """Paces requests across threads to one per min_interval seconds."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def acquire(self):
+        """Block until this thread is allowed to issue its request."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+# On-disk HTML cache: gzipped page bodies keyed by URL hash, with ETag /
+# Last-Modified sidecar metadata so unchanged pages revalidate with a
+# cheap conditional GET (304) instead of a full ~200 KB download.
+HTML_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", ".cache", "html"
+)
+
+_html_cache_enabled = True
+
+# --- Precompiled patterns (compiled once at import, reused per page) ---
+
+_Q = r'(?:\\"|")'  # matches either \" or "
+
+# Daily analytics entries embedded in model-page script data
+_DAILY_RE = re.compile(
+    _Q + r'date' + _Q + r':' + _Q + r'(\d{4}-\d{2}-\d{2})[^"\\]*' + _Q + r','
+    + _Q + r'model_permaslug' + _Q + r':' + _Q + r'[^"\\]*' + _Q + r','
+    + _Q + r'variant' + _Q + r':' + _Q + r'([^"\\]*)' + _Q + r','
+    + _Q + r'total_completion_tokens' + _Q + r':(\d+),'
+    + _Q + r'total_prompt_tokens' + _Q + r':(\d+),'
+    + _Q + r'total_native_tokens_reasoning' + _Q + r':(\d+),'
+    + _Q + r'count' + _Q + r':(\d+)'
+)
+_CACHED_RE = re.compile(
+    _Q + r'date' + _Q + r':' + _Q + r'(\d{4}-\d{2}-\d{2})[^"\\]*' + _Q + r','
+    + _Q + r'model_permaslug' + _Q + r'.*?'
+    + _Q + r'total_native_tokens_cached' + _Q + r':(\d+)'
+)
+
+# Next.js flight-data chunks: self.__next_f.push([1,"..."])
+_NEXT_PUSH_RE = re.compile(r'self\.__next_f\.push\(\[1,"((?:[^"\\]|\\.)*)"\]\)')
+
+# Rankings-page chart extraction
+_SCRIPT_RE = re.compile(r"<script[^>]*>(.*?)</script>", re.DOTALL)
+_XY_ENTRY_RE = re.compile(r'"x":"(\d{4}-\d{2}-\d{2})(?:[^"]*)?","ys":\{')
+_XY_ARRAY_RE = re.compile(r'\[\s*\{"x":"\d{4}-\d{2}-\d{2}')
+_UNESCAPE_RE = re.compile(r'\\(["\\])')
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+_YS_PAIR_RE = re.compile(r'"([^"]+)":(\d+(?:\.\d+)?)')
+
+# Rankings-page leaderboard rows
+_TOKEN_CELL_RE = re.compile(r"([0-9.]+)([TGBMK])tokens", re.IGNORECASE)
+_PCT_RE = re.compile(r"(\d+)%")
+
+# Human-readable token counts like "1.16T"
+_TOKEN_COUNT_RE = re.compile(r"^([0-9.]+)\s*([TGBMK])?$", re.IGNORECASE)
+
+# HTML-legend fallback for _scrape_model_activity_html, compiled once at
+# import: the DOTALL patterns are expensive to build per call.
+_HTML_ACTIVITY_PATS = {
+    key: re.compile(
+        rf'aria-label="{label}".*?'
+        rf'<div class="font-medium[^"]*"[^>]*>{label}</div>'
+        rf'.*?<div>([0-9.]+[TGBMK]?)</div>',
+        re.DOTALL,
+    )
+    for label, key in (
+        ("Prompt", "prompt_tokens"),
+        ("Completion", "completion_tokens"),
+        ("Reasoning", "reasoning_tokens"),
+    )
+}
+
+# Compiled XPath queries for the leaderboard grid (C-level tree walk,
+# much cheaper than regex class filters over a Python node traversal)
+_RANK_ROW_XPATH = XPath('//div[contains(@class, "grid grid-cols-12")]')
+_ROW_LINK_XPATH = XPath('.//a[contains(@class, "text-foreground")]')
+_ROW_TOKEN_COL_XPATH = XPath('.//div[contains(@class, "col-span-4")]')
+_ROW_SVG_XPATH = XPath('.//svg')
+
+
+def set_html_cache_enabled(enabled: bool):
+    """Globally enable/disable the on-disk HTML cache (--no-cache)."""
+    global _html_cache_enabled
+    _html_cache_enabled = enabled
+
 
 def parse_token_count(text: str) -> int:
     """Parse human-readable token counts like '1.16T', '706B', '445M', '13.4K'.
@@ -40,7 +159,7 @@ def parse_token_count(text: str) -> int:
         "M": 1_000_000,
         "K": 1_000,
     }
-    match = re.match(r"^([0-9.]+)\s*([TGBMK])?$", text, re.IGNORECASE)
+    match = _TOKEN_COUNT_RE.match(text)
     if not match:
         return 0
     number = float(match.group(1))
@@ -49,6 +168,15 @@ def parse_token_count(text: str) -> int:
     return int(number * multiplier)
 
 
+def fetch_rankings_html() -> str:
+    """Fetch the /rankings page HTML once, for reuse by multiple parsers."""
+    url = f"{BASE_URL}/rankings"
+    logger.info(f"Fetching rankings page from {url}")
+    resp = get_session().get(url, headers=HEADERS, timeout=30)
+    resp.raise_for_status()
+    return resp.text
+
+
 def scrape_rankings_history(html: str | None = None) -> list[dict]:
     """Extract per-model weekly token data from the rankings page chart.
 
@@ -76,76 +204,46 @@ def scrape_rankings_history(html: str | None = None) -> list[dict]:
         ]
     """
     if html is None:
-        url = f"{BASE_URL}/rankings"
-        logger.info(f"Fetching rankings page for historical chart data from {url}")
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        html = resp.text
+        html = fetch_rankings_html()
 
     # The rankings page contains multiple chart datasets in separate <script> tags.
     # We need the MAIN model-level weekly chart (the one with the most entries
     # that contain model slugs with "/" in them).
     # Strategy: parse each script tag independently, find the one with the most
-    # model-level entries, and use only that one.
-
-    script_tags = re.findall(r"<script[^>]*>(.*?)</script>", html, re.DOTALL)
+    # model-level entries, and use only that one. Scripts are scanned lazily
+    # via finditer (no up-front list of every script body) and the scan stops
+    # as soon as a script yields a full ~year of weekly entries.
 
     best_entries: list[dict] = []
 
-    for script in script_tags:
-        if len(script) < 1000:
-            continue
-
-        unescaped = script.replace('\\"', '"').replace('\\\\', '\\')
-
-        entries = []
-        for m in re.finditer(r'"x":"(\d{4}-\d{2}-\d{2})(?:[^"]*)?","ys":\{', unescaped):
-            date_str = m.group(1)
-            brace_start = m.end() - 1
-
-            depth = 0
-            brace_end = brace_start
-            for j in range(brace_start, min(brace_start + 10000, len(unescaped))):
-                if unescaped[j] == '{':
-                    depth += 1
-                elif unescaped[j] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        brace_end = j
-                        break
-
-            ys_str = unescaped[brace_start:brace_end + 1]
-            pairs = re.findall(r'"([^"]+)":(\d+(?:\.\d+)?)', ys_str)
-
-            if not pairs:
+    # Fast path: pages-router Next.js builds put all hydration data in one
+    # <script id="__NEXT_DATA__"> tag (plain JSON, no escaping). When that
+    # tag carries the weekly entries there is nothing to find elsewhere, so
+    # the per-script scan below is skipped entirely.
+    next_data = _NEXT_DATA_RE.search(html)
+    if next_data is not None:
+        best_entries = _parse_week_entries(next_data.group(1))
+
+    if not best_entries:
+        for tag in _SCRIPT_RE.finditer(html):
+            # Cheap size pre-filter before slicing the (possibly large) body out
+            if tag.end(1) - tag.start(1) < 1000:
                 continue
+            script = tag.group(1)
 
-            # Only consider entries where keys contain "/" (model slugs)
-            has_model_slugs = any("/" in p[0] for p in pairs)
-            if not has_model_slugs:
-                continue
+            # Single linear sub instead of two full-string .replace() rewrites
+            # over a possibly hundreds-of-KB script body
+            unescaped = _UNESCAPE_RE.sub(r"\1", script)
 
-            models = {}
-            others = 0
-            total = 0
-            for slug, tokens_str in pairs:
-                tokens = int(float(tokens_str))
-                total += tokens
-                if slug == "Others":
-                    others = tokens
-                else:
-                    models[slug] = tokens
-
-            entries.append({
-                "week_start": date_str,
-                "models": models,
-                "others": others,
-                "total": total,
-            })
-
-        # The main model rankings chart is the script with the most entries
-        if len(entries) > len(best_entries):
-            best_entries = entries
+            entries = _parse_week_entries(unescaped)
+
+            # The main model rankings chart is the script with the most entries
+            if len(entries) > len(best_entries):
+                best_entries = entries
+                # The chart carries ~53 weekly points; once we have a full year
+                # there is nothing better to find in the remaining scripts.
+                if len(best_entries) >= 52:
+                    break
 
     final = sorted(best_entries, key=lambda x: x["week_start"])
     logger.info(f"Extracted {len(final)} weeks of historical chart data")
@@ -155,9 +253,132 @@ def scrape_rankings_history(html: str | None = None) -> list[dict]:
     return final
 
 
-def scrape_rankings() -> list[dict]:
+def _parse_week_entries(unescaped: str) -> list[dict]:
+    """Parse weekly {x, ys} chart entries out of an unescaped script body.
+
+    Fast path: locate the whole [{"x":..., "ys":{...}}, ...] array and hand
+    it to the JSON parser in one shot. Fallback (non-strict-JSON payloads):
+    per-entry regex scan with find()-based brace matching.
+    """
+    m = _XY_ARRAY_RE.search(unescaped)
+    if m is not None:
+        end = _find_array_end(unescaped, m.start())
+        if end != -1:
+            try:
+                parsed = _json_loads(unescaped[m.start():end + 1])
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, list):
+                entries = []
+                for item in parsed:
+                    if not isinstance(item, dict):
+                        continue
+                    ys = item.get("ys")
+                    date_str = str(item.get("x", ""))[:10]
+                    if not isinstance(ys, dict) or not date_str:
+                        continue
+                    entry = _build_week_entry(date_str, ys.items())
+                    if entry is not None:
+                        entries.append(entry)
+                if entries:
+                    return entries
+
+    entries = []
+    for m in _XY_ENTRY_RE.finditer(unescaped):
+        date_str = m.group(1)
+        brace_start = m.end() - 1
+
+        # Hop between braces with str.find (C level) rather than walking
+        # the script character by character in Python.
+        depth = 0
+        brace_end = brace_start
+        pos = brace_start
+        limit = min(brace_start + 10000, len(unescaped))
+        while pos < limit:
+            next_close = unescaped.find('}', pos, limit)
+            if next_close == -1:
+                break
+            next_open = unescaped.find('{', pos, limit)
+            if next_open != -1 and next_open < next_close:
+                depth += 1
+                pos = next_open + 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    brace_end = next_close
+                    break
+                pos = next_close + 1
+
+        ys_str = unescaped[brace_start:brace_end + 1]
+        pairs = _YS_PAIR_RE.findall(ys_str)
+
+        if not pairs:
+            continue
+
+        entry = _build_week_entry(date_str, pairs)
+        if entry is not None:
+            entries.append(entry)
+
+    return entries
+
+
+def _build_week_entry(date_str: str, pairs) -> dict | None:
+    """Build one weekly entry from (slug, tokens) pairs, or None if the
+    pairs carry no "/"-style model slugs (i.e. it's not the model chart)."""
+    models = {}
+    others = 0
+    total = 0
+    has_model_slugs = False
+    for slug, tokens in pairs:
+        tokens = int(float(tokens))
+        total += tokens
+        if slug == "Others":
+            others = tokens
+        else:
+            if "/" in slug:
+                has_model_slugs = True
+            models[slug] = tokens
+
+    if not has_model_slugs:
+        return None
+    return {
+        "week_start": date_str,
+        "models": models,
+        "others": others,
+        "total": total,
+    }
+
+
+def parse_rankings_document(html: str) -> lxml.html.HtmlElement:
+    """Parse rankings-page HTML into a tree, for reuse across scrapers.
+
+    Parsing ~1 MB of HTML costs tens of milliseconds even with lxml, so
+    callers that need both the leaderboard and other page data should parse
+    once and pass the document around.
+    """
+    return lxml.html.fromstring(html)
+
+
+def _element_text(el) -> str:
+    """Concatenate an element's text nodes with each node stripped.
+
+    Matches BeautifulSoup's get_text(strip=True), which the token-cell
+    regex depends on ("1.16T" + "tokens" + "222%" with no separators).
+    """
+    return "".join(t.strip() for t in el.itertext())
+
+
+def scrape_rankings(
+    html: str | None = None,
+    doc: lxml.html.HtmlElement | None = None,
+) -> list[dict]:
     """Scrape the OpenRouter rankings page for the top models.
 
+    Args:
+        html: Pre-fetched HTML string. If None, fetches the rankings page.
+        doc: Pre-parsed document from parse_rankings_document(); takes
+            precedence over html and skips the parse entirely.
+
     Returns a list of dicts:
         [
             {
@@ -170,59 +391,56 @@ def scrape_rankings() -> list[dict]:
             ...
         ]
     """
-    url = f"{BASE_URL}/rankings"
-    logger.info(f"Fetching rankings from {url}")
-    resp = requests.get(url, headers=HEADERS, timeout=30)
-    resp.raise_for_status()
+    if doc is None:
+        if html is None:
+            html = fetch_rankings_html()
+        doc = parse_rankings_document(html)
 
-    soup = BeautifulSoup(resp.text, "lxml")
     results = []
     rank = 0
 
     # Each ranked model is inside a grid row: <div class="grid grid-cols-12 ...">
-    grid_rows = soup.find_all("div", class_=re.compile(r"grid grid-cols-12"))
-
-    for row in grid_rows:
+    for row in _RANK_ROW_XPATH(doc):
         # Model link: <a class="...text-foreground..." href="/author/model-slug">Name</a>
-        model_link = row.find("a", class_=re.compile(r"text-foreground"))
-        if not model_link:
+        links = _ROW_LINK_XPATH(row)
+        if not links:
             continue
+        model_link = links[0]
 
-        href = model_link.get("href", "")
+        href = model_link.get("href") or ""
         slug = href.lstrip("/")
 
         # Skip navigation links
         if not slug or slug.startswith(NAV_PREFIXES) or "/" not in slug:
             continue
 
-        name = model_link.get_text(strip=True)
+        name = _element_text(model_link)
         rank += 1
 
         # Token count: inside <div class="col-span-4 ...">
-        token_col = row.find("div", class_=re.compile(r"col-span-4"))
+        token_cols = _ROW_TOKEN_COL_XPATH(row)
         total_tokens = 0
         percent_change = 0
 
-        if token_col:
-            col_text = token_col.get_text(strip=True)
+        if token_cols:
+            token_col = token_cols[0]
+            col_text = _element_text(token_col)
 
             # Parse token count: extract "1.16T" from "1.16Ttokens222%"
-            token_match = re.match(r"([0-9.]+)([TGBMK])tokens", col_text, re.IGNORECASE)
+            token_match = _TOKEN_CELL_RE.match(col_text)
             if token_match:
                 token_str = token_match.group(1) + token_match.group(2)
                 total_tokens = parse_token_count(token_str)
 
             # Parse percentage: extract "222" from the end
-            pct_match = re.search(r"(\d+)%", col_text)
+            pct_match = _PCT_RE.search(col_text)
             if pct_match:
                 percent_change = int(pct_match.group(1))
 
             # Determine direction from SVG color class
-            svg = token_col.find("svg")
-            if svg:
-                svg_classes = " ".join(svg.get("class", []))
-                if "text-red" in svg_classes:
-                    percent_change = -percent_change
+            svgs = _ROW_SVG_XPATH(token_col)
+            if svgs and "text-red" in (svgs[0].get("class") or ""):
+                percent_change = -percent_change
 
         results.append({
             "rank": rank,
@@ -238,10 +456,96 @@ def scrape_rankings() -> list[dict]:
 
 # --- Daily analytics extraction (used by both normal and backfill modes) ---
 
+def _find_array_end(text: str, start: int) -> int:
+    """Index of the ] closing the JSON array at `start`, or -1.
+
+    String-aware bracket matching, so brackets inside string values don't
+    break the scan.
+    """
+    depth = 0
+    in_str = False
+    esc = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_str:
+            if esc:
+                esc = False
+            elif c == "\\":
+                esc = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == "[":
+            depth += 1
+        elif c == "]":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _extract_daily_data_json(html: str) -> dict[str, dict]:
+    """Extract daily analytics by JSON-parsing the Next.js flight data.
+
+    The analytics rows live in script chunks pushed via
+    self.__next_f.push([1,"..."]). Unescape each candidate chunk once and
+    JSON-parse the embedded row arrays -- a single linear C-level parse per
+    chunk instead of regex backtracking over the whole document.
+
+    Returns empty dict if no parseable rows are found (caller falls back
+    to the regex scan).
+    """
+    daily_totals: dict[str, dict] = {}
+
+    for m in _NEXT_PUSH_RE.finditer(html):
+        chunk = m.group(1)
+        if "total_prompt_tokens" not in chunk:
+            continue
+        try:
+            text = chunk.encode("utf-8").decode("unicode_escape")
+        except UnicodeDecodeError:
+            continue
+
+        idx = 0
+        while True:
+            start = text.find('[{"date":', idx)
+            if start == -1:
+                break
+            end = _find_array_end(text, start)
+            if end == -1:
+                break
+            try:
+                rows = _json_loads(text[start:end + 1])
+            except ValueError:
+                idx = start + 1
+                continue
+            idx = end + 1
+
+            for row in rows:
+                if not isinstance(row, dict) or "total_prompt_tokens" not in row:
+                    continue
+                date_str = str(row.get("date", ""))[:10]
+                if not date_str:
+                    continue
+                day = daily_totals.setdefault(date_str, {
+                    "prompt": 0, "completion": 0, "reasoning": 0, "cached": 0, "count": 0
+                })
+                day["prompt"] += int(row.get("total_prompt_tokens", 0))
+                day["completion"] += int(row.get("total_completion_tokens", 0))
+                day["reasoning"] += int(row.get("total_native_tokens_reasoning", 0))
+                day["cached"] += int(row.get("total_native_tokens_cached", 0))
+                day["count"] += int(row.get("count", 0))
+
+    return daily_totals
+
+
 def _extract_daily_data(html: str) -> dict[str, dict]:
     """Extract all daily analytics entries from a model page's HTML.
 
-    Parses the embedded Next.js script data for daily token counts.
+    Parses the embedded Next.js script data for daily token counts,
+    preferring the JSON flight-data path and falling back to the regex
+    scan for pages where the chunk format doesn't match.
 
     Returns:
         Dict mapping date string (YYYY-MM-DD) to:
@@ -254,29 +558,17 @@ def _extract_daily_data(html: str) -> dict[str, dict]:
         }
         Returns empty dict if no data found.
     """
-    Q = r'(?:\\"|")'  # matches either \" or "
-
-    daily_pattern = re.compile(
-        Q + r'date' + Q + r':' + Q + r'(\d{4}-\d{2}-\d{2})[^"\\]*' + Q + r','
-        + Q + r'model_permaslug' + Q + r':' + Q + r'[^"\\]*' + Q + r','
-        + Q + r'variant' + Q + r':' + Q + r'([^"\\]*)' + Q + r','
-        + Q + r'total_completion_tokens' + Q + r':(\d+),'
-        + Q + r'total_prompt_tokens' + Q + r':(\d+),'
-        + Q + r'total_native_tokens_reasoning' + Q + r':(\d+),'
-        + Q + r'count' + Q + r':(\d+)'
-    )
-    daily_entries = daily_pattern.findall(html)
+    daily_totals = _extract_daily_data_json(html)
+    if daily_totals:
+        return daily_totals
+
+    daily_entries = _DAILY_RE.findall(html)
 
     if not daily_entries:
         return {}
 
     # Extract cached tokens
-    cached_pattern = re.compile(
-        Q + r'date' + Q + r':' + Q + r'(\d{4}-\d{2}-\d{2})[^"\\]*' + Q + r','
-        + Q + r'model_permaslug' + Q + r'.*?'
-        + Q + r'total_native_tokens_cached' + Q + r':(\d+)'
-    )
-    cached_entries = cached_pattern.findall(html)
+    cached_entries = _CACHED_RE.findall(html)
     cached_by_date: dict[str, int] = {}
     for date_str, cached in cached_entries:
         cached_by_date[date_str] = cached_by_date.get(date_str, 0) + int(cached)
@@ -319,40 +611,100 @@ def sum_daily_window(
         Activity dict with prompt_tokens, completion_tokens, reasoning_tokens,
         cached_tokens, request_count.
     """
-    result = {
-        "prompt_tokens": 0,
-        "completion_tokens": 0,
-        "reasoning_tokens": 0,
-        "cached_tokens": 0,
-        "request_count": 0,
-    }
-
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-
-    dates_to_sum = []
-    for i in range(days):
-        d = (end - timedelta(days=i)).strftime("%Y-%m-%d")
+    # Date strings come from ordinal arithmetic + isoformat (both C level)
+    # rather than a strptime/strftime pair per day; this runs once per model
+    # per week during backfills.
+    end_ord = date.fromisoformat(end_date).toordinal()
+    today = datetime.utcnow().date().isoformat()
+
+    dates_to_sum = [
+        d
+        for i in range(days)
         # Skip today if partial
-        if skip_partial and d == today:
-            continue
-        dates_to_sum.append(d)
+        if (d := date.fromordinal(end_ord - i).isoformat()) != today or not skip_partial
+    ]
 
     # If we skipped today, add one more day at the start to keep 7 days
     if skip_partial and end_date == today and len(dates_to_sum) < days:
-        extra = (end - timedelta(days=days)).strftime("%Y-%m-%d")
-        dates_to_sum.append(extra)
-
-    for d in dates_to_sum:
-        if d in daily_data:
-            day = daily_data[d]
-            result["prompt_tokens"] += day["prompt"]
-            result["completion_tokens"] += day["completion"]
-            result["reasoning_tokens"] += day["reasoning"]
-            result["cached_tokens"] += day.get("cached", 0)
-            result["request_count"] += day["count"]
+        dates_to_sum.append(date.fromordinal(end_ord - days).isoformat())
+
+    window = [daily_data[d] for d in dates_to_sum if d in daily_data]
+    return {
+        "prompt_tokens": sum(day["prompt"] for day in window),
+        "completion_tokens": sum(day["completion"] for day in window),
+        "reasoning_tokens": sum(day["reasoning"] for day in window),
+        "cached_tokens": sum(day.get("cached", 0) for day in window),
+        "request_count": sum(day["count"] for day in window),
+    }
 
-    return result
+
+def _html_cache_paths(url: str) -> tuple[str, str]:
+    """(body, meta) cache file paths for a URL."""
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return (
+        os.path.join(HTML_CACHE_DIR, f"{key}.html.gz"),
+        os.path.join(HTML_CACHE_DIR, f"{key}.meta.json"),
+    )
+
+
+def fetch_cached(url: str, max_age_sec: int = 0) -> str:
+    """Fetch a URL through the on-disk HTML cache.
+
+    If a cached copy exists, a conditional GET (If-None-Match /
+    If-Modified-Since) is issued and the cached body is returned on 304.
+    With max_age_sec > 0, a fresh-enough cached copy skips the request
+    entirely. Raises requests.RequestException on network failure.
+    """
+    if not _html_cache_enabled:
+        resp = get_session().get(url, headers=HEADERS, timeout=30)
+        resp.raise_for_status()
+        return resp.text
+
+    body_path, meta_path = _html_cache_paths(url)
+    meta = None
+    if os.path.exists(meta_path) and os.path.exists(body_path):
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            meta = None
+
+    if meta and max_age_sec > 0 and time.time() - meta.get("fetched_at", 0) < max_age_sec:
+        with gzip.open(body_path, "rt", encoding="utf-8") as f:
+            return f.read()
+
+    headers = dict(HEADERS)
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = get_session().get(url, headers=headers, timeout=30)
+    if resp.status_code == 304 and meta:
+        logger.info(f"  304 Not Modified, using cached HTML for {url}")
+        with gzip.open(body_path, "rt", encoding="utf-8") as f:
+            return f.read()
+    resp.raise_for_status()
+
+    try:
+        os.makedirs(HTML_CACHE_DIR, exist_ok=True)
+        tmp_path = body_path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            f.write(resp.text)
+        os.replace(tmp_path, body_path)
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump({
+                "url": url,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }, f)
+        os.replace(meta_path + ".tmp", meta_path)
+    except IOError as e:
+        logger.warning(f"Failed to write HTML cache for {url}: {e}")
+
+    return resp.text
 
 
 # --- Public scraping functions ---
@@ -374,13 +726,12 @@ def scrape_model_daily_data(slug: str) -> dict[str, dict]:
     logger.info(f"Fetching model daily data from {url}")
 
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
+        html = fetch_cached(url)
     except requests.RequestException as e:
         logger.warning(f"Failed to fetch {url}: {e}")
         return {}
 
-    daily_data = _extract_daily_data(resp.text)
+    daily_data = _extract_daily_data(html)
     if daily_data:
         sorted_dates = sorted(daily_data.keys())
         logger.info(
@@ -410,16 +761,15 @@ def scrape_model_activity(slug: str) -> dict:
     }
 
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
+        html = fetch_cached(url)
     except requests.RequestException as e:
         logger.warning(f"Failed to fetch {url}: {e}")
         return default_result
 
-    daily_data = _extract_daily_data(resp.text)
+    daily_data = _extract_daily_data(html)
     if not daily_data:
         logger.warning(f"No embedded analytics found for {slug}, falling back to HTML parsing")
-        return _scrape_model_activity_html(resp.text)
+        return _scrape_model_activity_html(html)
 
     # Sum the most recent 7 full days (skip partial today)
     sorted_dates = sorted(daily_data.keys(), reverse=True)
@@ -448,19 +798,7 @@ def _scrape_model_activity_html(html: str) -> dict:
         "request_count": 0,
     }
 
-    token_type_map = {
-        "Prompt": "prompt_tokens",
-        "Completion": "completion_tokens",
-        "Reasoning": "reasoning_tokens",
-    }
-
-    for label, key in token_type_map.items():
-        pattern = re.compile(
-            rf'aria-label="{label}".*?'
-            rf'<div class="font-medium[^"]*"[^>]*>{label}</div>'
-            rf'.*?<div>([0-9.]+[TGBMK]?)</div>',
-            re.DOTALL,
-        )
+    for key, pattern in _HTML_ACTIVITY_PATS.items():
         match = pattern.search(html)
         if match:
             result[key] = parse_token_count(match.group(1))
@@ -468,52 +806,77 @@ def _scrape_model_activity_html(html: str) -> dict:
     return result
 
 
-def scrape_all_model_activities(rankings: list[dict], delay: float = REQUEST_DELAY) -> dict:
+def _scrape_all_threaded(
+    rankings: list[dict],
+    fetch_fn,
+    what: str,
+    delay: float,
+    max_workers: int,
+) -> dict:
+    """Fan per-model fetches out over a thread pool, rate-limited globally."""
+    limiter = _RateLimiter(min_interval=delay / max_workers)
+    results = {}
+    done = 0
+    log_lock = threading.Lock()
+
+    def fetch(slug: str):
+        limiter.acquire()
+        return slug, fetch_fn(slug)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch, model["slug"]) for model in rankings]
+        for future in concurrent.futures.as_completed(futures):
+            slug, result = future.result()
+            results[slug] = result
+            with log_lock:
+                done += 1
+                logger.info(f"[{done}/{len(rankings)}] Scraped {what} for {slug}")
+
+    return results
+
+
+def scrape_all_model_activities(
+    rankings: list[dict],
+    delay: float = REQUEST_DELAY,
+    max_workers: int = MAX_WORKERS,
+) -> dict:
     """Scrape activity data for all ranked models (current week only).
 
+    Fetches run concurrently on a thread pool; the shared rate limiter
+    keeps the aggregate request rate at max_workers per delay window.
+
     Args:
         rankings: List of ranked model dicts from scrape_rankings()
-        delay: Seconds to wait between requests
+        delay: Politeness budget per max_workers requests (seconds)
+        max_workers: Concurrent fetches in flight
 
     Returns:
         Dict mapping slug -> activity dict
     """
-    activities = {}
-    for i, model in enumerate(rankings):
-        slug = model["slug"]
-        logger.info(f"[{i+1}/{len(rankings)}] Scraping activity for {slug}")
-        activities[slug] = scrape_model_activity(slug)
-
-        # Be polite: delay between requests (skip after last)
-        if i < len(rankings) - 1:
-            time.sleep(delay)
-
-    return activities
+    return _scrape_all_threaded(
+        rankings, scrape_model_activity, "activity", delay, max_workers
+    )
 
 
 def scrape_all_model_daily_data(
     rankings: list[dict],
     delay: float = REQUEST_DELAY,
+    max_workers: int = MAX_WORKERS,
 ) -> dict[str, dict[str, dict]]:
     """Scrape full daily history for all ranked models.
 
-    Makes one request per model and returns the complete daily data set,
-    which can then be sliced into arbitrary weekly windows for backfill.
+    Makes one request per model (concurrently, rate-limited) and returns
+    the complete daily data set, which can then be sliced into arbitrary
+    weekly windows for backfill.
 
     Args:
         rankings: List of ranked model dicts from scrape_rankings()
-        delay: Seconds to wait between requests
+        delay: Politeness budget per max_workers requests (seconds)
+        max_workers: Concurrent fetches in flight
 
     Returns:
         Dict mapping slug -> {date -> daily_totals}
     """
-    all_daily = {}
-    for i, model in enumerate(rankings):
-        slug = model["slug"]
-        logger.info(f"[{i+1}/{len(rankings)}] Scraping daily data for {slug}")
-        all_daily[slug] = scrape_model_daily_data(slug)
-
-        if i < len(rankings) - 1:
-            time.sleep(delay)
-
-    return all_daily
+    return _scrape_all_threaded(
+        rankings, scrape_model_daily_data, "daily data", delay, max_workers
+    )